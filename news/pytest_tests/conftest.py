@@ -1,46 +1,140 @@
 """Фикстуры для тестов приложения news.
 
 Общие данные и настройки для всех тестов pytest.
+
+Локально pytest.ini включает --nomigrations: схема создаётся сразу
+по моделям, без прогона миграций. В CI (задана переменная окружения CI)
+миграции применяются. Тестовая база живёт в памяти, поэтому между
+запусками она не сохраняется.
 """
+import os
+
 import pytest
 
-from datetime import datetime, timedelta  # type: ignore
+from datetime import timedelta  # type: ignore
 # Импортируем класс клиента.
 from django.test.client import Client  # type: ignore
 from django.conf import settings  # type: ignore
+from django.contrib.auth import get_user_model  # type: ignore
+from django.db import connection, transaction  # type: ignore
+from django.urls import reverse  # type: ignore
 from django.utils import timezone  # type: ignore
 
 # Импортируем модель заметки, чтобы создать экземпляр.
 from news.models import News, Comment
+from news.tests._helpers import insert_home_news
 
-today = datetime.today()
 
+def pytest_configure(config):
+    """В CI отключаем пропуск миграций."""
+    if os.environ.get('CI'):
+        config.option.nomigrations = False
 
-@pytest.fixture
-def author(django_user_model):
-    """Используем фикстуру для модели пользователей и создаем автора."""
-    return django_user_model.objects.create(username='Лев Толстой')
 
+@pytest.fixture(autouse=True)
+def forbid_transactional_db(request):
+    """Запрещаем тестам использовать transactional_db.
 
-@pytest.fixture
-def not_author(django_user_model):
-    """Используем фикстуру для модели пользователей и создаем НЕ_автора."""
-    return django_user_model.objects.create(username='Читатель простой')
+    Такие тесты очищают всю базу после себя вместо отката транзакции,
+    что многократно медленнее.
+    """
+    marker = request.node.get_closest_marker('django_db')
+    if (
+        'transactional_db' in request.fixturenames
+        or (marker and marker.kwargs.get('transaction'))
+    ):
+        pytest.fail(
+            'Используйте @pytest.mark.django_db(transaction=False) '
+            'вместо transactional_db.'
+        )
+
+
+@pytest.fixture(scope='session')
+def users(django_db_setup, django_db_blocker):
+    """Создаём автора и НЕ_автора один раз на всю сессию тестов.
+
+    django_db_blocker.unblock() не выводит запись из уже открытой
+    транзакции: пользователь, впервые созданный внутри теста, исчез бы
+    вместе с её откатом. Поэтому фикстуру заранее вызывает
+    create_users_before_db.
+    """
+    user_model = get_user_model()
+    with django_db_blocker.unblock():
+        author, _ = user_model.objects.get_or_create(username='Лев Толстой')
+        not_author, _ = user_model.objects.get_or_create(
+            username='Читатель простой'
+        )
+    yield author, not_author
+    # Пользователи созданы вне транзакций тестов, поэтому удаляем их сами.
+    with django_db_blocker.unblock():
+        user_model.objects.filter(
+            pk__in=(author.pk, not_author.pk)
+        ).delete()
+
+
+@pytest.fixture(scope='module', autouse=True)
+def create_users_before_db(request):
+    """Создаём пользователей до транзакции первого теста модуля.
+
+    Фикстура модульная, поэтому срабатывает раньше транзакции теста.
+    Модули, где нет тестов с django_db, её пропускают и не создают
+    тестовую базу ради пользователей.
+    """
+    if any(
+        item.get_closest_marker('django_db')
+        for item in request.session.items
+        if item.module is request.module
+    ):
+        request.getfixturevalue('users')
+
+
+@pytest.fixture(scope='session')
+def author(users):
+    """Автор, общий для всей сессии тестов."""
+    return users[0]
+
+
+@pytest.fixture(scope='session')
+def not_author(users):
+    """НЕ_автор, общий для всей сессии тестов."""
+    return users[1]
+
+
+@pytest.fixture(scope='session')
+def author_session_cookie(author, django_db_blocker):
+    """Логиним автора один раз и запоминаем cookie его сессии.
+
+    Сессии хранятся в подписанных cookie (см. yanews.settings_test),
+    поэтому cookie можно переиспользовать в любом клиенте.
+    """
+    client = Client()
+    with django_db_blocker.unblock():
+        client.force_login(author)
+    return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+
+@pytest.fixture(scope='session')
+def not_author_session_cookie(not_author, django_db_blocker):
+    """Логиним обычного пользователя один раз и запоминаем cookie сессии."""
+    client = Client()
+    with django_db_blocker.unblock():
+        client.force_login(not_author)
+    return client.cookies[settings.SESSION_COOKIE_NAME].value
 
 
 @pytest.fixture
-def author_client(author):
-    """Вызоваем фикстуру автора и создаём новый экземпляр клиента, логиним."""
+def author_client(author_session_cookie):
+    """Создаём новый экземпляр клиента с готовой сессией автора."""
     client = Client()
-    client.force_login(author)  # логиним автора в клиенте
+    client.cookies[settings.SESSION_COOKIE_NAME] = author_session_cookie
     return client
 
 
 @pytest.fixture
-def not_author_client(not_author):
-    """Фикстура логинит обычного пользователя."""
+def not_author_client(not_author_session_cookie):
+    """Фикстура создаёт клиент с готовой сессией обычного пользователя."""
     client = Client()
-    client.force_login(not_author)
+    client.cookies[settings.SESSION_COOKIE_NAME] = not_author_session_cookie
     return client
 
 
@@ -66,29 +160,103 @@ def comment(author, news):
 
 
 @pytest.fixture
-def create_news():
-    """Фикстура создаёт новости для тестов главной страницы."""
-    from news.models import News  # Импортируем здесь, если нужно
-    News.objects.bulk_create(
-        News(
-            title=f'Новость {index}',
+def detail_url(news):
+    """Фикстура возвращает адрес страницы новости."""
+    return reverse('news:detail', args=(news.id,))
+
+
+@pytest.fixture(scope='module')
+def module_detail_url(module_news):
+    """Фикстура возвращает адрес страницы новости из module_news."""
+    return reverse('news:detail', args=(module_news.id,))
+
+
+@pytest.fixture
+def edit_url(comment):
+    """Фикстура возвращает адрес редактирования комментария."""
+    return reverse('news:edit', args=(comment.id,))
+
+
+@pytest.fixture
+def delete_url(comment):
+    """Фикстура возвращает адрес удаления комментария."""
+    return reverse('news:delete', args=(comment.id,))
+
+
+@pytest.fixture(scope='module')
+def module_news(django_db_setup, django_db_blocker):
+    """Фикстура создаёт новость один раз на модуль тестов."""
+    with django_db_blocker.unblock():
+        news = News.objects.create(
+            title='Тестовая новость',
             text='Просто текст.',
-            date=today - timedelta(days=index)
         )
-        for index in range(settings.NEWS_COUNT_ON_HOME_PAGE + 1)
-    )
+    yield news
+    # Новость создана вне транзакции теста, поэтому удаляем её сами.
+    with django_db_blocker.unblock():
+        news.delete()
 
 
-@pytest.fixture
-def create_comments(news, author):
-    """Фикстура создаёт комментарии с разными датами создания."""
-    from news.models import Comment  # Импортируем здесь, если нужно
-    now = timezone.now()
-    for index in range(10):
+@pytest.fixture(scope='module')
+def comment_module(django_db_blocker, module_news, author):
+    """Фикстура создаёт комментарий Автора один раз на модуль тестов.
+
+    Подходит только для тестов, которые не меняют комментарий.
+    """
+    with django_db_blocker.unblock():
         comment = Comment.objects.create(
-            news=news,
+            news=module_news,
             author=author,
-            text=f'Текст {index}',
+            text='Текст комментария',
+        )
+    yield comment
+    with django_db_blocker.unblock():
+        comment.delete()
+
+
+@pytest.fixture(scope='module')
+def create_news(django_db_setup, django_db_blocker):
+    """Фикстура создаёт новости для тестов главной страницы.
+
+    Новости создаются один раз на модуль и удаляются после него.
+    """
+    # Все вставки фикстуры фиксируются одной транзакцией.
+    with django_db_blocker.unblock(), transaction.atomic():
+        titles = insert_home_news()
+    yield
+    with django_db_blocker.unblock():
+        News.objects.filter(title__in=titles).delete()
+
+
+@pytest.fixture(scope='module')
+def create_comments(django_db_blocker, module_news, author):
+    """Фикстура создаёт комментарии с разными датами создания.
+
+    Комментарии создаются один раз на модуль и удаляются вместе
+    с новостью из module_news.
+    Вставка в обход ORM позволяет сразу задать created,
+    не дожидаясь auto_now_add.
+    """
+    now = timezone.now()
+    rows = [
+        (
+            module_news.id,
+            author.id,
+            f'Текст {index}',
+            connection.ops.adapt_datetimefield_value(
+                now + timedelta(days=index)
+            ),
+        )
+        for index in range(10)
+    ]
+    with (
+        django_db_blocker.unblock(),
+        transaction.atomic(),
+        connection.cursor() as cursor,
+    ):
+        cursor.executemany(
+            f'INSERT INTO {Comment._meta.db_table} '
+            '(news_id, author_id, text, created) '
+            'VALUES (%s, %s, %s, %s)',
+            rows,
         )
-        comment.created = now + timedelta(days=index)
-        comment.save()
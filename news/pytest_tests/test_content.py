@@ -13,29 +13,29 @@ from django.urls import reverse  # type: ignore
 
 from news.forms import CommentForm
 
+HOME_URL = reverse('news:home')
 
-@pytest.mark.django_db
+
+@pytest.mark.django_db(transaction=False)
 def test_news_count(client, create_news):
     """Проверяет количество новостей на главной странице.
 
     Убеждается, что количество не превышает установленный лимит.
     """
     # Загружаем главную страницу
-    home_url = reverse('news:home')
-    response = client.get(home_url)
+    response = client.get(HOME_URL)
     # Получаем список объектов из словаря контекста
     object_list = response.context['object_list']
     # Определяем количество записей в списке
-    news_count = object_list.count()
+    news_count = len(object_list)
     # Проверяем, что на странице именно NEWS_COUNT_ON_HOME_PAGE новостей
     assert news_count == settings.NEWS_COUNT_ON_HOME_PAGE
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 def test_news_order(client, create_news):
     """Тест: Новости на главной странице отсортированы от свежих к старым."""
-    home_url = reverse('news:home')
-    response = client.get(home_url)
+    response = client.get(HOME_URL)
     object_list = response.context['object_list']
     # Получаем даты новостей в том порядке, как они выведены на странице
     all_dates = [news.date for news in object_list]
@@ -45,11 +45,10 @@ def test_news_order(client, create_news):
     assert all_dates == sorted_dates
 
 
-@pytest.mark.django_db
-def test_comments_order(client, news, create_comments):
+@pytest.mark.django_db(transaction=False)
+def test_comments_order(client, module_detail_url, create_comments):
     """Тест:Комментарии на странице новости отсортированы от старых к новым."""
-    detail_url = reverse('news:detail', args=(news.id,))
-    response = client.get(detail_url)
+    response = client.get(module_detail_url)
     # Проверяем, что объект новости находится в словаре контекста
     assert 'news' in response.context
     # Получаем объект новости
@@ -64,21 +63,18 @@ def test_comments_order(client, news, create_comments):
     assert all_timestamps == sorted_timestamps
 
 
-@pytest.mark.django_db
-def test_anonymous_client_has_no_form(client, news):
-    """Тест: Анонимному пользователю не доступна форма для комментария."""
-    detail_url = reverse('news:detail', args=(news.id,))
+@pytest.mark.django_db(transaction=False)
+def test_form_visibility(client, author_client, detail_url):
+    """Тест: Форма для комментария доступна только авторизованному.
+
+    Оба запроса выполняются в одном тесте, чтобы новость
+    создавалась один раз.
+    """
+    # Анонимному пользователю форма не передаётся
     response = client.get(detail_url)
-    # Проверяем, что формы нет в контексте
     assert 'form' not in response.context
-
-
-@pytest.mark.django_db
-def test_authorized_client_has_form(author_client, news):
-    """Тест: Авторизованному пользователю доступна форма для комментария."""
-    detail_url = reverse('news:detail', args=(news.id,))
+    # Авторизованному пользователю форма доступна
     response = author_client.get(detail_url)
-    # Проверяем, что форма есть в контексте
     assert 'form' in response.context
     # Проверяем, что объект формы соответствует нужному классу формы
     assert isinstance(response.context['form'], CommentForm)
@@ -9,7 +9,6 @@
 import pytest
 from http import HTTPStatus
 
-from django.urls import reverse  # type: ignore
 from pytest_django.asserts import assertRedirects  # type: ignore
 
 from news.forms import BAD_WORDS, WARNING
@@ -19,51 +18,49 @@ from news.models import Comment
 # Тексты для комментариев - выносим в константы для переиспользования
 COMMENT_TEXT = 'Текст комментария'
 NEW_COMMENT_TEXT = 'Обновлённый комментарий'
+# Текст с запрещённым словом
+BAD_WORD_TEXT = f'Какой-то текст, {BAD_WORDS[0]}, еще текст'
 
 
-@pytest.mark.django_db
-def test_anonymous_user_cant_create_comment(client, news):
+@pytest.mark.django_db(transaction=False)
+def test_anonymous_user_cant_create_comment(client, detail_url):
     """Тест: Анонимный пользователь не может создать комментарий."""
-    # Формируем URL страницы новости
-    url = reverse('news:detail', args=(news.id,))
     # Данные для формы комментария
     form_data = {'text': COMMENT_TEXT}
     # Отправляем POST-запрос от анонимного пользователя
-    client.post(url, data=form_data)
+    client.post(detail_url, data=form_data)
     # Проверяем, что комментарий не создался
     comments_count = Comment.objects.count()
     assert comments_count == 0
 
 
-@pytest.mark.django_db
-def test_user_can_create_comment(author_client, news, author):
+@pytest.mark.django_db(transaction=False)
+def test_user_can_create_comment(author_client, news, author, detail_url):
     """Тест: Авторизованный пользователь может создать комментарий."""
-    # Формируем URL страницы новости
-    url = reverse('news:detail', args=(news.id,))
     # Данные для формы комментария
     form_data = {'text': COMMENT_TEXT}
     # Отправляем POST-запрос от авторизованного пользователя
-    response = author_client.post(url, data=form_data)
+    response = author_client.post(detail_url, data=form_data)
     # Проверяем редирект на страницу с комментариями
-    assertRedirects(response, f'{url}#comments')
+    assertRedirects(response, f'{detail_url}#comments')
     # Проверяем, что комментарий создался
     comments_count = Comment.objects.count()
     assert comments_count == 1
-    # Проверяем атрибуты созданного комментария
-    comment = Comment.objects.get()
-    assert comment.text == COMMENT_TEXT
-    assert comment.news == news
-    assert comment.author == author
+    # Проверяем атрибуты созданного комментария, не собирая модель целиком
+    row = Comment.objects.values('text', 'news_id', 'author_id').first()
+    assert row == {
+        'text': COMMENT_TEXT,
+        'news_id': news.id,
+        'author_id': author.id,
+    }
 
 
-@pytest.mark.django_db
-def test_user_cant_use_bad_words(author_client, news):
+@pytest.mark.django_db(transaction=False)
+def test_user_cant_use_bad_words(author_client, detail_url):
     """Тест: Пользователь не может использовать запрещённые слова."""
-    # Формируем текст с запрещённым словом
-    bad_words_data = {'text': f'Какой-то текст, {BAD_WORDS[0]}, еще текст'}
-    url = reverse('news:detail', args=(news.id,))
+    bad_words_data = {'text': BAD_WORD_TEXT}
     # Отправляем POST-запрос с запрещённым словом
-    response = author_client.post(url, data=bad_words_data)
+    response = author_client.post(detail_url, data=bad_words_data)
     # Проверяем, что в форме есть ошибка
     assert 'form' in response.context
     form = response.context['form']
@@ -74,14 +71,11 @@ def test_user_cant_use_bad_words(author_client, news):
     assert comments_count == 0
 
 
-@pytest.mark.django_db
-def test_author_can_delete_comment(author_client, comment, news):
+@pytest.mark.django_db(transaction=False)
+def test_author_can_delete_comment(author_client, delete_url, detail_url):
     """Тест: Автор может удалить свой комментарий."""
-    # Формируем URL для удаления комментария
-    delete_url = reverse('news:delete', args=(comment.id,))
     # Формируем ожидаемый URL редиректа (к комментариям новости)
-    news_url = reverse('news:detail', args=(news.id,))
-    url_to_comments = f'{news_url}#comments'
+    url_to_comments = f'{detail_url}#comments'
     # Отправляем DELETE-запрос от автора комментария
     response = author_client.delete(delete_url)
     # Проверяем редирект на страницу с комментариями
@@ -93,10 +87,11 @@ def test_author_can_delete_comment(author_client, comment, news):
     assert comments_count == 0
 
 
-@pytest.mark.django_db
-def test_user_cant_delete_comment_of_another_user(not_author_client, comment):
+@pytest.mark.django_db(transaction=False)
+def test_user_cant_delete_comment_of_another_user(
+    not_author_client, delete_url
+):
     """Тест: Пользователь не может удалить чужой комментарий."""
-    delete_url = reverse('news:delete', args=(comment.id,))
     # Отправляем DELETE-запрос от пользователя, который не автор
     response = not_author_client.delete(delete_url)
     # Проверяем, что вернулась 404 ошибка (доступ запрещён)
@@ -106,14 +101,11 @@ def test_user_cant_delete_comment_of_another_user(not_author_client, comment):
     assert comments_count == 1
 
 
-@pytest.mark.django_db
-def test_author_can_edit_comment(author_client, comment, news):
+@pytest.mark.django_db(transaction=False)
+def test_author_can_edit_comment(author_client, comment, edit_url, detail_url):
     """Тест: Автор может редактировать свой комментарий."""
-    # Формируем URL для редактирования комментария
-    edit_url = reverse('news:edit', args=(comment.id,))
     # Формируем ожидаемый URL редиректа
-    news_url = reverse('news:detail', args=(news.id,))
-    url_to_comments = f'{news_url}#comments'
+    url_to_comments = f'{detail_url}#comments'
     # Данные для обновления комментария
     form_data = {'text': NEW_COMMENT_TEXT}
     # Отправляем POST-запрос на редактирование от автора
@@ -126,10 +118,11 @@ def test_author_can_edit_comment(author_client, comment, news):
     assert comment.text == NEW_COMMENT_TEXT
 
 
-@pytest.mark.django_db
-def test_user_cant_edit_comment_of_another_user(not_author_client, comment):
+@pytest.mark.django_db(transaction=False)
+def test_user_cant_edit_comment_of_another_user(
+    not_author_client, comment, edit_url
+):
     """Тест: Пользователь не может редактировать чужой комментарий."""
-    edit_url = reverse('news:edit', args=(comment.id,))
     form_data = {'text': NEW_COMMENT_TEXT}
     # Отправляем POST-запрос на редактирование от не-автора
     response = not_author_client.post(edit_url, data=form_data)
@@ -0,0 +1,39 @@
+"""Модуль тестирования редиректов анонимных пользователей.
+
+Содержит тесты для проверки:
+- Редиректов анонимных пользователей на страницу авторизации
+
+Тестам этого модуля база данных не нужна: анонимный пользователь
+перенаправляется на логин раньше, чем view ищет комментарий,
+поэтому вместо настоящего комментария используется объект с id.
+"""
+import pytest
+from types import SimpleNamespace
+
+from pytest_django.asserts import assertRedirects
+from django.urls import reverse  # type: ignore
+
+LOGIN_URL = reverse('users:login')
+# Комментарий с таким id существовать не обязан
+COMMENT = SimpleNamespace(id=1)
+
+
+@pytest.mark.parametrize(
+    'url',
+    (
+        reverse('news:edit', args=(COMMENT.id,)),
+        reverse('news:delete', args=(COMMENT.id,)),
+    ),
+)
+def test_redirect_for_anonymous_client(client, url):
+    """Тестирует редирект анонимных пользователей.
+
+    Проверяет, что анонимные пользователи при попытке редактирования
+    или удаления комментария перенаправляются на страницу логина
+    с параметром next.
+    """
+    # Формируем полный URL редиректа с параметром next:
+    redirect_url = f'{LOGIN_URL}?next={url}'
+    response = client.get(url)
+    # Проверяем редирект:
+    assertRedirects(response, redirect_url)
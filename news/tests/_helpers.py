@@ -0,0 +1,37 @@
+"""Вспомогательные функции, общие для тестов unittest и pytest."""
+from datetime import timedelta  # type: ignore
+
+from django.conf import settings  # type: ignore
+from django.db import connection  # type: ignore
+from django.utils import timezone  # type: ignore
+
+from news.models import News  # type: ignore
+
+
+def insert_home_news():
+    """
+    Создаёт новости для тестов главной страницы.
+
+    Новостей на одну больше, чем выводится на главной странице.
+    Строки вставляются одним executemany в обход ORM.
+    Возвращает заголовки созданных новостей.
+    """
+    # Дату берём в момент вызова и в часовом поясе проекта.
+    today = timezone.localdate()
+    rows = [
+        (
+            f'Новость {index}',
+            'Просто текст.',
+            connection.ops.adapt_datefield_value(
+                today - timedelta(days=index)
+            ),
+        )
+        for index in range(settings.NEWS_COUNT_ON_HOME_PAGE + 1)
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {News._meta.db_table} (title, text, date) '
+            'VALUES (%s, %s, %s)',
+            rows,
+        )
+    return [title for title, _, _ in rows]
@@ -8,19 +8,19 @@
 - Доступности форм комментариев для авторизованных пользователей
 - Корректности передачи данных в контекст шаблонов
 """
-from datetime import datetime, timedelta  # type: ignore
+from datetime import timedelta  # type: ignore
 
 from django.conf import settings  # type: ignore
 from django.test import TestCase  # type: ignore
 from django.urls import reverse  # type: ignore
 from django.contrib.auth import get_user_model  # type: ignore
+from django.db import transaction  # type: ignore
+from django.db.models import Case, DateTimeField, Value, When  # type: ignore
 from django.utils import timezone  # type: ignore
 
 from news.models import News, Comment  # type: ignore
 from news.forms import CommentForm  # type: ignore
-
-# Текущая дата.
-today = datetime.today()
+from news.tests._helpers import insert_home_news
 
 User = get_user_model()
 
@@ -44,14 +44,7 @@ class TestHomePage(TestCase):
         Создает количество новостей, превышающее лимит отображения,
         для проверки корректности пагинации.
         """
-        News.objects.bulk_create(
-            News(
-                title=f'Новость {index}',
-                text='Просто текст.',
-                date=today - timedelta(days=index)
-            )
-            for index in range(settings.NEWS_COUNT_ON_HOME_PAGE + 1)
-        )
+        insert_home_news()
 
     def test_news_count(self):
         """
@@ -66,7 +59,7 @@ class TestHomePage(TestCase):
         # Получаем список объектов из словаря контекста.
         object_list = response.context['object_list']
         # Определяем количество записей в списке.
-        news_count = object_list.count()
+        news_count = len(object_list)
         # Проверяем, что на странице именно 10 новостей.
         self.assertEqual(news_count, settings.NEWS_COUNT_ON_HOME_PAGE)
 
@@ -103,24 +96,39 @@ class TestDetailPage(TestCase):
         Создает тестовую новость, пользователя и набор комментариев
         с разными датами создания для проверки сортировки.
         """
-        cls.news = News.objects.create(
-            title='Тестовая новость', text='Просто текст.'
-        )
-        # Сохраняем в переменную адрес страницы с новостью:
-        cls.detail_url = reverse('news:detail', args=(cls.news.id,))
-        cls.author = User.objects.create(username='Комментатор')
-        # Запоминаем текущее время:
-        now = timezone.now()
-        # Создаём комментарии в цикле.
-        for index in range(10):
-            # Создаём объект и записываем его в переменную.
-            comment = Comment.objects.create(
-                news=cls.news, author=cls.author, text=f'Tекст {index}',
+        # Фиксируем все вставки одной транзакцией.
+        with transaction.atomic():
+            cls.news = News.objects.create(
+                title='Тестовая новость', text='Просто текст.'
+            )
+            # Сохраняем в переменную адрес страницы с новостью:
+            cls.detail_url = reverse('news:detail', args=(cls.news.id,))
+            cls.author = User.objects.create(username='Комментатор')
+            # Запоминаем текущее время:
+            now = timezone.now()
+            # Создаём все комментарии одним запросом.
+            comments = Comment.objects.bulk_create(
+                Comment(
+                    news=cls.news, author=cls.author, text=f'Tекст {index}'
+                )
+                for index in range(10)
+            )
+            # Время создания выставляется автоматически при вставке,
+            # поэтому меняем его для всех комментариев одним UPDATE.
+            Comment.objects.filter(
+                pk__in=[comment.pk for comment in comments]
+            ).update(
+                created=Case(
+                    *(
+                        When(
+                            pk=comment.pk,
+                            then=Value(now + timedelta(days=index))
+                        )
+                        for index, comment in enumerate(comments)
+                    ),
+                    output_field=DateTimeField(),
+                )
             )
-            # Сразу после создания меняем время создания комментария.
-            comment.created = now + timedelta(days=index)
-            # И сохраняем эти изменения.
-            comment.save()
 
     def test_comments_order(self):
         """
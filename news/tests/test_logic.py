@@ -6,28 +6,71 @@
 - Валидации текста комментариев на наличие запрещенных слов
 - Редактирования и удаления комментариев с проверкой прав доступа
 - Изоляции данных между авторами и другими пользователями
+
+Данные из setUpTestData общие для всех тестов класса: не изменяйте их
+в тестах. Если тест меняет объект в БД, перечитайте его из базы
+(refresh_from_db() или отдельным запросом), а не полагайтесь
+на атрибуты класса.
+
+Пользователей создавайте через User.objects.create и логиньте через
+force_login, а не create_user/login: так тесты не тратят время
+на хеширование паролей.
 """
+from functools import lru_cache
 from http import HTTPStatus
 
 from django.contrib.auth import get_user_model  # type: ignore
-from django.test import Client, TestCase  # type: ignore
+from django.db import transaction  # type: ignore
+from django.test import Client, SimpleTestCase, TestCase  # type: ignore
 from django.urls import reverse  # type: ignore
 
 # Импортируем из файла с формами список стоп-слов и предупреждение формы.
 # Загляните в news/forms.py, разберитесь с их назначением.
-from news.forms import BAD_WORDS, WARNING
+from news.forms import BAD_WORDS, WARNING, CommentForm
 from news.models import Comment, News
 
 User = get_user_model()
 
 
-class TestCommentCreation(TestCase):
+@lru_cache(maxsize=None)
+def _edit_url(comment_id):
+    """Адрес редактирования комментария, вычисляется один раз на id."""
+    return reverse('news:edit', args=(comment_id,))
+
+
+@lru_cache(maxsize=None)
+def _delete_url(comment_id):
+    """Адрес удаления комментария, вычисляется один раз на id."""
+    return reverse('news:delete', args=(comment_id,))
+
+
+class _NewsFixture(TestCase):
+    """
+    Общие тестовые данные для тестов комментариев.
+
+    Создаёт новость и вычисляет адреса её страницы и блока комментариев.
+    Наследники должны вызывать super().setUpTestData() первым делом.
+
+    На уровне класса храним только id объектов, а не сами объекты:
+    Django глубоко копирует атрибуты из setUpTestData перед каждым тестом.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт новость и формирует её адреса."""
+        cls.news_id = News.objects.create(title='Заголовок', text='Текст').id
+        # Адрес страницы с новостью.
+        cls.detail_url = reverse('news:detail', args=(cls.news_id,))
+        # Адрес блока с комментариями.
+        cls.comments_anchor_url = cls.detail_url + '#comments'
+
+
+class TestCommentCreation(_NewsFixture):
     """
     Тестирование логики создания комментариев в приложении новостей.
 
     Проверяет сценарии создания комментариев для различных типов пользователей,
-    включая анонимных пользователей, авторизованных пользователей,
-    а также обработку комментариев с запрещенными словами.
+    включая анонимных и авторизованных пользователей.
     """
 
     # Текст комментария понадобится в нескольких местах кода,
@@ -40,18 +83,15 @@ class TestCommentCreation(TestCase):
         Подготавливает тестовые данные для создания комментариев.
 
         Инициализирует:
-        - Тестовую новость
-        - URL страницы новости
         - Тестового пользователя и авторизованный клиент
         - Данные формы для POST-запроса создания комментария
         """
-        cls.news = News.objects.create(title='Заголовок', text='Текст')
-        # Адрес страницы с новостью.
-        cls.url = reverse('news:detail', args=(cls.news.id,))
+        super().setUpTestData()
         # Создаём пользователя и клиент, логинимся в клиенте.
-        cls.user = User.objects.create(username='Мимо Крокодил')
+        user = User.objects.create(username='Мимо Крокодил')
+        cls.user_id = user.id
         cls.auth_client = Client()
-        cls.auth_client.force_login(cls.user)
+        cls.auth_client.force_login(user)
         # Данные для POST-запроса при создании комментария.
         cls.form_data = {'text': cls.COMMENT_TEXT}
 
@@ -64,60 +104,60 @@ class TestCommentCreation(TestCase):
         """
         # Совершаем запрос от анонимного клиента, в POST-запросе отправляем
         # предварительно подготовленные данные формы с текстом комментария.
-        self.client.post(self.url, data=self.form_data)
-        # Считаем количество комментариев.
-        comments_count = Comment.objects.count()
-        # Ожидаем, что комментариев в базе нет - сравниваем с нулём.
-        self.assertEqual(comments_count, 0)
+        self.client.post(self.detail_url, data=self.form_data)
+        # Ожидаем, что комментариев в базе нет.
+        self.assertFalse(Comment.objects.exists())
 
     def test_user_can_create_comment(self):
         """
         Проверяет успешное создание комментария авторизованным пользователем.
 
-        Проверяет редирект на блок комментариев, увеличение количества
-        комментариев в базе данных и корректное сохранение всех атрибутов
-        созданного комментария.
+        Проверяет редирект на блок комментариев и то, что в базе данных
+        появился ровно один комментарий с корректными атрибутами.
         """
         # Совершаем запрос через авторизованный клиент.
-        response = self.auth_client.post(self.url, data=self.form_data)
+        response = self.auth_client.post(self.detail_url, data=self.form_data)
         # Проверяем, что редирект привёл к разделу с комментами.
-        self.assertRedirects(response, f'{self.url}#comments')
-        # Считаем количество комментариев.
-        comments_count = Comment.objects.count()
-        # Убеждаемся, что есть один комментарий.
-        self.assertEqual(comments_count, 1)
-        # Получаем объект комментария из базы.
-        comment = Comment.objects.get()
+        self.assertRedirects(response, self.comments_anchor_url)
+        # Получаем единственный комментарий одним запросом; get() упадёт,
+        # если комментариев нет или их больше одного.
+        row = Comment.objects.values('text', 'news_id', 'author_id').get()
         # Проверяем, что все атрибуты комментария совпадают с ожидаемыми.
-        self.assertEqual(comment.text, self.COMMENT_TEXT)
-        self.assertEqual(comment.news, self.news)
-        self.assertEqual(comment.author, self.user)
+        self.assertEqual(
+            row,
+            {
+                'text': self.COMMENT_TEXT,
+                'news_id': self.news_id,
+                'author_id': self.user_id,
+            }
+        )
 
-    def test_user_cant_use_bad_words(self):
+
+class TestBadWordsForm(SimpleTestCase):
+    """
+    Тестирование валидации комментариев на запрещённые слова.
+
+    Проверяет только форму, поэтому база данных не нужна.
+    """
+
+    # Текст включает первое слово из списка стоп-слов.
+    bad_words_data = {'text': f'Какой-то текст, {BAD_WORDS[0]}, еще текст'}
+
+    def test_bad_word_rejected(self):
         """
         Проверяет валидацию текста комментария на наличие запрещенных слов.
 
         Убеждается, что комментарии содержащие слова из списка BAD_WORDS
-        не проходят валидацию формы и не создаются в базе данных.
+        не проходят валидацию формы.
         """
-        # Формируем данные для отправки формы; текст включает
-        # первое слово из списка стоп-слов.
-        bad_words_data = {'text': f'Какой-то текст, {BAD_WORDS[0]}, еще текст'}
-        # Отправляем запрос через авторизованный клиент.
-        response = self.auth_client.post(self.url, data=bad_words_data)
-        form = response.context['form']
-        # Проверяем, есть ли в ответе ошибка формы.
-        self.assertFormError(
-            form=form,
-            field='text',
-            errors=WARNING
-        )
-        # Дополнительно убедимся, что комментарий не был создан.
-        comments_count = Comment.objects.count()
-        self.assertEqual(comments_count, 0)
+        # Валидируем форму напрямую, без запроса к view.
+        form = CommentForm(data=self.bad_words_data)
+        self.assertFalse(form.is_valid())
+        # Проверяем, что в форме есть нужная ошибка.
+        self.assertIn(WARNING, form.errors['text'])
 
 
-class TestCommentEditDelete(TestCase):
+class TestCommentEditDelete(_NewsFixture):
     """
     Тестирование логики редактирования и удаления комментариев.
 
@@ -138,105 +178,89 @@ class TestCommentEditDelete(TestCase):
         Подготавливает тестовые данные для операций редактирования и удаления.
 
         Инициализирует:
-        - Тестовую новость и URL блока комментариев
         - Автора комментария и другого пользователя
         - Авторизованные клиенты для обоих пользователей
         - Тестовый комментарий
         - URL для операций редактирования и удаления
         - Данные для обновления комментария
         """
-        # Создаём новость в БД.
-        cls.news = News.objects.create(title='Заголовок', text='Текст')
-        # Формируем адрес блока с комментариями, который нужен для тестов.
-        news_url = reverse('news:detail', args=(cls.news.id,))
-        cls.url_to_comments = news_url + '#comments'
-        # Создаём пользователя - автора комментария.
-        cls.author = User.objects.create(username='Автор комментария')
+        # Новость и адрес блока с комментариями создаёт базовый класс.
+        super().setUpTestData()
+        # Создаём автора комментария и читателя одним запросом.
+        author, reader = User.objects.bulk_create([
+            User(username='Автор комментария'),
+            User(username='Читатель'),
+        ])
         # Создаём клиент для пользователя-автора.
         cls.author_client = Client()
         # "Логиним" пользователя в клиенте.
-        cls.author_client.force_login(cls.author)
+        cls.author_client.force_login(author)
         # Делаем всё то же самое для пользователя-читателя.
-        cls.reader = User.objects.create(username='Читатель')
         cls.reader_client = Client()
-        cls.reader_client.force_login(cls.reader)
-        # Создаём объект комментария.
-        cls.comment = Comment.objects.create(
-            news=cls.news,
-            author=cls.author,
+        cls.reader_client.force_login(reader)
+        # Создаём комментарий и запоминаем его id.
+        cls.comment_id = Comment.objects.create(
+            news_id=cls.news_id,
+            author=author,
             text=cls.COMMENT_TEXT
-        )
+        ).id
         # URL для редактирования комментария.
-        cls.edit_url = reverse('news:edit', args=(cls.comment.id,))
+        cls.edit_url = _edit_url(cls.comment_id)
         # URL для удаления комментария.
-        cls.delete_url = reverse('news:delete', args=(cls.comment.id,))
+        cls.delete_url = _delete_url(cls.comment_id)
         # Формируем данные для POST-запроса по обновлению комментария.
         cls.form_data = {'text': cls.NEW_COMMENT_TEXT}
 
-    def test_author_can_delete_comment(self):
-        """
-        Проверяет возможность автора удалить свой комментарий.
-
-        Убеждается, что DELETE-запрос от автора выполняется успешно,
-        происходит редирект на блок комментариев и комментарий удаляется
-        из базы данных.
-        """
-        # От имени автора комментария отправляем DELETE-запрос на удаление.
-        response = self.author_client.delete(self.delete_url)
-        # Проверяем, что редирект привёл к разделу с комментариями.
-        self.assertRedirects(response, self.url_to_comments)
-        # Заодно проверим статус-коды ответов.
-        self.assertEqual(response.status_code, HTTPStatus.FOUND)
-        # Считаем количество комментариев в системе.
-        comments_count = Comment.objects.count()
-        # Ожидаем ноль комментариев в системе.
-        self.assertEqual(comments_count, 0)
-
-    def test_user_cant_delete_comment_of_another_user(self):
-        """
-        Проверяет запрет удаления чужих комментариев.
-
-        Убеждается, что пользователь не может удалить комментарий
-        другого пользователя и получает ошибку 404 Not Found.
-        """
-        # Выполняем запрос на удаление от пользователя-читателя.
-        response = self.reader_client.delete(self.delete_url)
-        # Проверяем, что вернулась 404 ошибка.
-        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
-        # Убедимся, что комментарий по-прежнему на месте.
-        comments_count = Comment.objects.count()
-        self.assertEqual(comments_count, 1)
-
-    def test_author_can_edit_comment(self):
+    def test_edit_delete_permissions(self):
         """
-        Проверяет возможность автора редактировать свой комментарий.
+        Проверяет права на редактирование и удаление комментария.
 
-        Убеждается, что POST-запрос на редактирование от автора
-        выполняется успешно, происходит редирект и текст комментария
-        обновляется в базе данных.
+        Автор может удалить и отредактировать свой комментарий: запрос
+        перенаправляет на блок комментариев, а изменения попадают в БД.
+        Другой пользователь получает ошибку 404 Not Found, комментарий
+        остаётся прежним. Каждый случай выполняется в точке сохранения,
+        которая откатывается после проверок, поэтому случаи не влияют
+        друг на друга.
         """
-        # Выполняем запрос на редактирование от имени автора комментария.
-        response = self.author_client.post(self.edit_url, data=self.form_data)
-        # Проверяем, что сработал редирект.
-        self.assertRedirects(response, self.url_to_comments)
-        # Обновляем объект комментария.
-        self.comment.refresh_from_db()
-        # Проверяем, что текст комментария соответствует обновленному.
-        self.assertEqual(self.comment.text, self.NEW_COMMENT_TEXT)
-
-    def test_user_cant_edit_comment_of_another_user(self):
-        """
-        Проверяет запрет редактирования чужих комментариев.
-
-        Убеждается, что пользователь не может редактировать комментарий
-        другого пользователя, получает ошибку 404 Not Found и исходный
-        текст комментария остается неизменным.
-        """
-        # Выполняем запрос на редактирование от имени другого пользователя.
-        response = self.reader_client.post(self.edit_url, data=self.form_data)
-        # Проверяем, что вернулась 404 ошибка.
-        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
-        # Обновляем объект комментария.
-        self.comment.refresh_from_db()
-        # Проверяем, что текст остался тем же, что и был.
-        self.assertEqual(self.comment.text, self.COMMENT_TEXT)
+        # Клиент, HTTP-метод, адрес, ожидаемый статус и ожидаемый текст
+        # комментария после запроса (None - комментарий удалён).
+        cases = (
+            (
+                self.author_client, 'delete', self.delete_url,
+                HTTPStatus.FOUND, None,
+            ),
+            (
+                self.reader_client, 'delete', self.delete_url,
+                HTTPStatus.NOT_FOUND, self.COMMENT_TEXT,
+            ),
+            (
+                self.author_client, 'post', self.edit_url,
+                HTTPStatus.FOUND, self.NEW_COMMENT_TEXT,
+            ),
+            (
+                self.reader_client, 'post', self.edit_url,
+                HTTPStatus.NOT_FOUND, self.COMMENT_TEXT,
+            ),
+        )
+        for client, method, url, status, expected_text in cases:
+            with self.subTest(method=method, url=url, status=status):
+                savepoint = transaction.savepoint()
+                try:
+                    if method == 'post':
+                        response = client.post(url, data=self.form_data)
+                    else:
+                        response = client.delete(url)
+                    if status == HTTPStatus.FOUND:
+                        # Проверяем, что редирект привёл к комментариям.
+                        self.assertRedirects(
+                            response, self.comments_anchor_url
+                        )
+                    else:
+                        self.assertEqual(response.status_code, status)
+                    # Читаем из БД только текст комментария.
+                    text = Comment.objects.filter(
+                        pk=self.comment_id
+                    ).values_list('text', flat=True).first()
+                    self.assertEqual(text, expected_text)
+                finally:
+                    transaction.savepoint_rollback(savepoint)
@@ -0,0 +1,20 @@
+"""Настройки проекта для запуска тестов.
+
+Тестовая база SQLite живёт в памяти и не пишет на диск,
+сессии хранятся в подписанных cookie, а не в базе данных,
+а пароли хешируются быстрым (и небезопасным) MD5.
+"""
+from .settings import *  # noqa: F401, F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]